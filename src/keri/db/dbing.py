@@ -71,9 +71,11 @@ def dgKey(pre, dig):
     bytes pre and qualified Base64 bytes digest of serialized event
     If pre or dig are str then converts to bytes
     """
-    if hasattr(pre, "encode"):
+    if type(pre) is bytes and type(dig) is bytes:  # usual case skip conversion
+        return (b'%s.%s' %  (pre, dig))
+    if isinstance(pre, str):
         pre = pre.encode("utf-8")  # convert str to bytes
-    if hasattr(dig, "encode"):
+    if isinstance(dig, str):
         dig = dig.encode("utf-8")  # convert str to bytes
     return (b'%s.%s' %  (pre, dig))
 
@@ -84,7 +86,7 @@ def onKey(pre, sn):
     bytes pre and int ordinal number of event, such as sequence number or first
     seen order number.
     """
-    if hasattr(pre, "encode"):
+    if isinstance(pre, str):
         pre = pre.encode("utf-8")  # convert str to bytes
     return (b'%s.%032x' % (pre, sn))
 
@@ -101,9 +103,11 @@ def dtKey(pre, dts):
     '2021-02-13T19:16:50.750302+00:00'
 
     """
-    if hasattr(pre, "encode"):
+    if type(pre) is bytes and type(dts) is bytes:  # usual case skip conversion
+        return (b'%s|%s' % (pre, dts))
+    if isinstance(pre, str):
         pre = pre.encode("utf-8")  # convert str to bytes
-    if hasattr(dts, "encode"):
+    if isinstance(dts, str):
         dts = dts.encode("utf-8")  # convert str to bytes
     return (b'%s|%s' % (pre, dts))
 
@@ -276,6 +280,8 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        bulk (bool): True means open LMDB env tuned for bulk loads, see reopen
+        writemap (bool): True means open LMDB env with MDB_WRITEMAP
 
     Properties:
 
@@ -303,8 +309,9 @@ class LMDBer(filing.Filer):
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
+    BulkWindow = 500000  # max puts per committed txn in .bulkPut
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, bulk=False, writemap=None, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -338,15 +345,22 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            bulk (bool): True means open database tuned for bulk loads
+                         False means open database with full durability
+            writemap (bool): True means use writeable memory map
+                             False means do not
+                             None means same as bulk
 
         """
 
         self.env = None
         self._version = None
         self.readonly = True if readonly else False
+        self.bulk = True if bulk else False
+        self.writemap = self.bulk if writemap is None else bool(writemap)
         super(LMDBer, self).__init__(**kwa)
 
-    def reopen(self, readonly=False, **kwa):
+    def reopen(self, readonly=False, bulk=None, writemap=None, **kwa):
         """
         Open if closed or close and reopen if opened or create and open if not
         if not preexistent, directory path for lmdb at .path and then
@@ -370,16 +384,44 @@ class LMDBer(filing.Filer):
             fext (str): File extension when .filed
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            bulk (bool): True means open database tuned for bulk loads
+                         False means open database with full durability
+                         None means keep .bulk
+            writemap (bool): True means use writeable memory map
+                             False means do not
+                             None means keep .writemap unless bulk given
+
+        Bulk mode opens the env with metasync=False, sync=False and
+        map_async=True so commits do not wait on fsync, and with writemap
+        unless writemap is False. This greatly speeds up large ingests such
+        as replays but a crash may lose the most recent commits, or with
+        writemap may corrupt the database if the process writes stray memory.
+        Use it only for loads that can be rerun from their source and call
+        env.sync(True) when done. When the load is much larger than RAM set
+        writemap=False since a writeable map then thrashes the page cache.
         """
         exists = self.exists(name=self.name, base=self.base)
         opened = super(LMDBer, self).reopen(**kwa)
         if readonly is not None:
             self.readonly = readonly
+        if bulk is not None:
+            self.bulk = True if bulk else False
+            if writemap is None:
+                self.writemap = self.bulk
+        if writemap is not None:
+            self.writemap = True if writemap else False
+
+        tuning = {}
+        if not self.readonly:
+            tuning = dict(writemap=self.writemap,
+                          metasync=not self.bulk,
+                          sync=not self.bulk,
+                          map_async=self.bulk)
 
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
         self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=104857600,
-                             mode=self.perm, readonly=self.readonly)
+                             mode=self.perm, readonly=self.readonly, **tuning)
 
         self.opened = True if opened and self.env else False
 
@@ -534,6 +576,51 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    def bulkPut(self, db, items, *, append=False, window=None):
+        """
+        Write each (key, val) item to db committing every window puts.
+        Does not overwrite existing val if any
+        Returns True If every val successfully written Else False
+
+        A single txn holding many hundreds of MB of dirty pages makes LMDB
+        slow down sharply so large loads are committed in windows. Vals
+        already committed stay written if a later window fails.
+
+        Parameters:
+            db is opened named sub db with dupsort=False
+            items (Iterable): of (key, val) duples
+            append (bool): True means try MDB_APPEND first which skips b-tree
+                search and page splits when items are in increasing key order
+                and sort after last key in db. Otherwise falls back to put.
+                False means always normal put
+            window (int): max puts per committed txn. Default .BulkWindow
+        """
+        window = window if window is not None else self.BulkWindow
+        result = True
+        count = 0
+        txn = self.env.begin(db=db, write=True, buffers=True)
+        try:
+            cursor = txn.cursor()
+            for key, val in items:
+                if not (append and cursor.put(key, val, append=True, overwrite=False)):
+                    result = cursor.put(key, val, overwrite=False) and result
+                count += 1
+                if count >= window:  # commit window and start next
+                    txn.commit()
+                    txn = self.env.begin(db=db, write=True, buffers=True)
+                    cursor = txn.cursor()
+                    count = 0
+        except lmdb.BadValsizeError as ex:
+            txn.abort()
+            raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
+                           " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
+        except BaseException:
+            txn.abort()
+            raise
+        txn.commit()
+        return result
+
+
     def cnt(self, db):
         """
         Return count of values in db, or zero otherwise
@@ -1261,9 +1348,8 @@ class LMDBer(filing.Filer):
         with self.env.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
-            try:
-                if cursor.set_key(key):  # moves to first_dup
-                    vals = [val for val in cursor.iternext_dup()]
+            try:  # all dups at key in one call
+                vals = [val for _, val in cursor.getmulti([key], dupdata=True)]
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
@@ -1474,10 +1560,9 @@ class LMDBer(filing.Filer):
         with self.env.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
-            try:
-                if cursor.set_key(key):  # moves to first_dup
-                    # slice off prepended ordering proem
-                    vals = [val[33:] for val in cursor.iternext_dup()]
+            try:  # all dups at key in one call
+                # slice off prepended ordering proem
+                vals = [val[33:] for _, val in cursor.getmulti([key], dupdata=True)]
                 return vals
             except lmdb.BadValsizeError as ex:
                 raise KeyError(f"Key: `{key}` is either empty, too big (for lmdb),"
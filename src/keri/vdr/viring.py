@@ -8,6 +8,7 @@ Provides public simple Verifiable Credential Issuance/Revocation Registry
 A special purpose Verifiable Data Registry (VDR)
 """
 
+import functools
 from dataclasses import dataclass, field, asdict
 from  ordered_set import OrderedSet as oset
 
@@ -17,12 +18,30 @@ from .. import kering
 from ..app import signing
 from ..core import coring, serdering, indexing
 from ..db import dbing, basing
-from ..db.dbing import snKey
-from ..help import helping
-from ..vc import proving
 from ..vdr import eventing
 
 
+# attachment count code headers used when cloning TEL events and credential
+# sources. Only the count varies so cache the qb64b instead of building a
+# Counter and looking up its CtrDex code each time
+_SEAL_SOURCE_COUPLE_HDR = coring.Counter(code=coring.CtrDex.SealSourceCouples,
+                                         count=1).qb64b
+_SEAL_SOURCE_TRIPLE_HDR = coring.Counter(code=coring.CtrDex.SealSourceTriples,
+                                         count=1).qb64b
+
+
+@functools.lru_cache(maxsize=256)
+def _witIdxSigsHdr(count):
+    """ Returns cached qb64b of WitnessIdxSigs counter with count """
+    return coring.Counter(code=coring.CtrDex.WitnessIdxSigs, count=count).qb64b
+
+
+@functools.lru_cache(maxsize=256)
+def _attachmentGroupHdr(count):
+    """ Returns cached qb64b of AttachmentGroup counter with count of quadlets """
+    return coring.Counter(code=coring.CtrDex.AttachmentGroup, count=count).qb64b
+
+
 class rbdict(dict):
     """ Reger backed read through cache for registry state
 
@@ -166,6 +185,8 @@ def openReger(name="test", **kwa):
     Parameters:
         name (str): registry database name
         **kwa (dict) keyword arguments to pass to LMDB
+            such as bulk=True to open tuned for bulk TEL ingest,
+            see LMDBer.reopen for its durability tradeoff
 
     """
     return dbing.openLMDB(cls=Reger, name=name, **kwa)
@@ -500,52 +521,76 @@ class Reger(dbing.LMDBer):
             fn (int): first seen ordinal
 
         Returns:
-            iterator: bytearray per serializeed event msg
+            iterator: bytes per serialized event msg
 
         """
-        if hasattr(pre, 'encode'):
+        if isinstance(pre, str):
             pre = pre.encode("utf-8")
 
-        for fn, dig in self.getTelItemPreIter(pre, fn=fn):
-            msg = self.cloneTvt(pre, dig)
-            yield msg
+        # one read txn with persistent cursors for whole replay
+        with self.env.begin(write=False, buffers=True) as txn:
+            telc = txn.cursor(self.tels)
+            tvtc = txn.cursor(self.tvts)
+            tibc = txn.cursor(self.tibs)
+            ancc = txn.cursor(self.ancs)
+
+            pdot = pre + b'.'  # both snKey and dgKey for pre start with pdot
+            for fn, dig in self._telItemIter(telc, pdot, fn):
+                yield self._cloneTvt(tvtc, tibc, ancc, pdot + dig, dig)
 
     def cloneTvtAt(self, pre, sn=0):
         snkey = dbing.snKey(pre, sn)
-        dig = self.getTel(key=snkey)
-        return self.cloneTvt(pre, dig)
+        with self.env.begin(write=False, buffers=True) as txn:
+            dig = txn.get(snkey, db=self.tels)
+            return self._cloneTvt(txn.cursor(self.tvts),
+                                  txn.cursor(self.tibs),
+                                  txn.cursor(self.ancs),
+                                  dbing.dgKey(pre, dig), dig)
 
     def cloneTvt(self, pre, dig):
-        msg = bytearray()  # message
-        atc = bytearray()  # attachments
-        dgkey = dbing.dgKey(pre, dig)  # get message
-        if not (raw := self.getTvt(key=dgkey)):
+        with self.env.begin(write=False, buffers=True) as txn:
+            return self._cloneTvt(txn.cursor(self.tvts),
+                                  txn.cursor(self.tibs),
+                                  txn.cursor(self.ancs),
+                                  dbing.dgKey(pre, dig), dig)
+
+    @staticmethod
+    def _cloneTvt(tvtc, tibc, ancc, dgkey, dig):
+        """ Returns event message with attachments read via cursors
+
+        Parameters:
+            tvtc (lmdb.Cursor): cursor on .tvts in open read txn
+            tibc (lmdb.Cursor): cursor on .tibs in open read txn
+            ancc (lmdb.Cursor): cursor on .ancs in open read txn
+            dgkey (bytes): dgKey of TEL prefix and event digest
+            dig (bytes): qb64b digest of event
+
+        """
+        # raw and tibs are buffers into mapped pages valid until the read txn
+        # ends so they are joined below without intermediate copies
+        if not (raw := tvtc.get(dgkey)):
+            if isinstance(dig, memoryview):  # buffer from read txn
+                dig = bytes(dig)
             raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
+        atc = []  # attachment fragments joined once below
 
         # add indexed backer signatures to attachments
-        if tibs := self.getTibs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                      count=len(tibs)).qb64b)
-            for tib in tibs:
-                atc.extend(tib)
+        if tibc.set_key(dgkey):  # moves to first_dup
+            atc.append(_witIdxSigsHdr(tibc.count()))
+            atc.extend(tibc.iternext_dup())
 
         # add authorizer (delegator/issure) source seal event couple to attachments
-        couple = self.getAnc(dgkey)
+        couple = ancc.get(dgkey)
         if couple is not None:
-            atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                      count=1).qb64b)
-            atc.extend(couple)
+            atc.append(_SEAL_SOURCE_COUPLE_HDR)
+            atc.append(couple)
 
         # prepend pipelining counter to attachments
-        if len(atc) % 4:
+        size = sum(map(len, atc))
+        if size & 3:  # not multiple of 4
             raise ValueError("Invalid attachments size={}, nonintegral"
-                             " quadlets.".format(len(atc)))
-        pcnt = coring.Counter(code=coring.CtrDex.AttachmentGroup,
-                              count=(len(atc) // 4)).qb64b
-        msg.extend(pcnt)
-        msg.extend(atc)
-        return msg
+                             " quadlets.".format(size))
+        return b"".join([raw, _attachmentGroupHdr(size >> 2), *atc])
 
     def sources(self, db, creder):
         """ Returns raw bytes of any source ('e') credential that is in our database
@@ -573,7 +618,7 @@ class Reger(dbing.LMDBer):
         for said in saids:
             screder, prefixer, seqner, saider = self.cloneCred(said=said)
 
-            atc = bytearray(coring.Counter(coring.CtrDex.SealSourceTriples, count=1).qb64b)
+            atc = bytearray(_SEAL_SOURCE_TRIPLE_HDR)
             atc.extend(prefixer.qb64b)
             atc.extend(seqner.qb64b)
             atc.extend(saider.qb64b)
@@ -618,6 +663,22 @@ class Reger(dbing.LMDBer):
         """
         return self.delVal(self.tvts, key)
 
+    def putTvts(self, items, window=None):
+        """
+        Use dgKey()
+        Write each (key, val) item of serialized VC bytes in bulk
+        Does not overwrite existing val if any
+        Returns True If every val successfully written Else False
+
+        Items are sorted by key so appending to end of db may skip b-tree
+        search and page splits. See LMDBer.bulkPut
+
+        Parameters:
+            items (Iterable): of (key, val) duples
+            window (int): max puts per committed txn
+        """
+        return self.bulkPut(self.tvts, sorted(items), append=True, window=window)
+
     def putTel(self, key, val):
         """
         Use snKey()
@@ -653,6 +714,27 @@ class Reger(dbing.LMDBer):
         """
         return self.delVal(self.tels, key)
 
+    def putTels(self, pre, items, window=None):
+        """
+        Write each (fn, dig) item for prefix pre in bulk
+        Does not overwrite existing val if any
+        Returns True If every dig successfully written Else False
+
+        Items must be in increasing fn order so replay ingest appends to end
+        of db skipping b-tree search and page splits. See LMDBer.bulkPut
+
+        Parameters:
+            pre (bytes): identifier prefix of TEL
+            items (Iterable): of (fn, dig) duples in increasing fn order
+            window (int): max puts per committed txn
+        """
+        if isinstance(pre, str):
+            pre = pre.encode("utf-8")  # convert str to bytes
+
+        return self.bulkPut(self.tels, ((dbing.snKey(pre, fn), dig)
+                                        for fn, dig in items),
+                            append=True, window=window)
+
     def getTelItemPreIter(self, pre, fn=0):
         """
         Returns iterator of all (fn, dig) duples in first seen order for all events
@@ -668,7 +750,48 @@ class Reger(dbing.LMDBer):
             pre is bytes of itdentifier prefix
             fn is int fn to resume replay. Earliset is fn=0
         """
-        return self.getAllOrdItemPreIter(db=self.tels, pre=pre, on=fn)
+        return self.getTelItemRangeIter(pre, fn=fn)
+
+    def getTelItemRangeIter(self, pre, fn=0, end=None):
+        """
+        Returns iterator of (fn, dig) duples in first seen order for events
+        with prefix, pre, whose fn is in range fn up to but not including end.
+        Scans .tels directly from snKey(pre, fn) so no per row key split.
+
+        Parameters:
+            pre (bytes): identifier prefix of TEL
+            fn (int): first fn in range. Earliest is fn=0
+            end (int): fn one past last in range. None means through last event
+        """
+        if isinstance(pre, str):
+            pre = pre.encode("utf-8")
+
+        with self.env.begin(db=self.tels, write=False, buffers=True) as txn:
+            yield from self._telItemIter(txn.cursor(), pre + b'.', fn, end)
+
+    @staticmethod
+    def _telItemIter(cursor, pdot, fn=0, end=None):
+        """
+        Returns iterator of (fn, dig) duples from cursor on .tels for prefix
+        starting at fn up to but not including end when end is not None.
+
+        Parameters:
+            cursor (lmdb.Cursor): cursor on .tels in open txn
+            pdot (bytes): identifier prefix of TEL plus b'.' separator
+            fn (int): first fn in range
+            end (int): fn one past last in range or None for no upper bound
+        """
+        size = len(pdot)  # all keys for prefix start with pdot followed by hex fn
+        if not cursor.set_range(b'%s%032x' % (pdot, fn)):  # snKey, moves to key >= key
+            return  # no values end of db
+
+        for key, dig in cursor.iternext():
+            if key[:size] != pdot:  # past last event for pre
+                break
+            cn = int(bytes(key[size:]), 16)
+            if end is not None and cn >= end:
+                break
+            yield (cn, dig)
 
     def cntTels(self, pre, fn=0):
         """
@@ -679,7 +802,7 @@ class Reger(dbing.LMDBer):
             pre is bytes of itdentifier prefix
             fn is int fn to resume replay. Earliset is fn=0
         """
-        if hasattr(pre, "encode"):
+        if isinstance(pre, str):
             pre = pre.encode("utf-8")  # convert str to bytes
 
         return self.cntValsAllPre(db=self.tels, pre=pre, on=fn)
@@ -247,6 +247,23 @@ def test_lmdber():
     assert not os.path.exists(databaser.path)
     assert not databaser.opened
 
+    # test bulk load tuning
+    with openLMDB() as dber:
+        assert not dber.bulk and not dber.writemap
+        flags = dber.env.flags()
+        assert flags["sync"] and flags["metasync"] and not flags["writemap"]
+
+    with openLMDB(bulk=True) as dber:
+        assert dber.bulk and dber.writemap
+        flags = dber.env.flags()
+        assert flags["writemap"] and flags["map_async"]
+        assert not flags["sync"] and not flags["metasync"]
+
+    with openLMDB(bulk=True, writemap=False) as dber:
+        assert dber.bulk and not dber.writemap
+        flags = dber.env.flags()
+        assert not flags["writemap"] and not flags["sync"]
+
     with openLMDB() as dber:
         assert dber.temp == True
         #test Val methods
@@ -263,6 +280,16 @@ def test_lmdber():
         assert dber.delVal(db, key) == True
         assert dber.getVal(db, key) == None
 
+        # Test bulkPut with commit windows
+        items = [(b"k.%d" % i, b"v%d" % i) for i in range(5)]
+        assert dber.bulkPut(db, items, append=True, window=2) == True
+        assert [dber.getVal(db, key) for key, _ in items] == [val for _, val in items]
+        assert dber.bulkPut(db, [(b"j.0", b"w"), (b"k.0", b"w")], window=1) == False
+        assert dber.getVal(db, b"j.0") == b"w"
+        assert dber.getVal(db, b"k.0") == b"v0"  # not overwritten
+        for key in [b"j.0"] + [key for key, _ in items]:
+            assert dber.delVal(db, key) == True
+
         # Test getAllItemIter(self, db, key=b'', split=True, sep=b'.')
         key = b"a.1"
         val = b"wow"
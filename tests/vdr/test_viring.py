@@ -8,7 +8,9 @@ import json
 import os
 
 import lmdb
+import pytest
 
+from keri.core import Signer
 from keri.core.coring import Diger, versify, Serials
 from keri.db.dbing import openLMDB, dgKey, snKey
 from keri.vdr.viring import Reger
@@ -112,6 +114,24 @@ def test_issuer():
         assert issuer.delTel(telKey) is True
         assert issuer.getTel(telKey) is None
 
+        # bulk writes in one txn
+        assert issuer.putTels(regk, [(sn, vdig.qb64b), (sn + 1, vdig.qb64b)]) is True
+        assert issuer.putTels(regk, [(sn + 1, vdig.qb64b)]) is False  # no overwrite
+        assert issuer.putTels(regk[:-1], [(sn, vdig.qb64b)]) is True  # not at end of db
+        assert issuer.getTel(snKey(regk, sn + 1)) == vdig.qb64b
+        assert issuer.getTel(snKey(regk[:-1], sn)) == vdig.qb64b
+        assert issuer.cntTels(regk) == 2
+        for pre, fn in ((regk, sn), (regk, sn + 1), (regk[:-1], sn)):
+            assert issuer.delTel(snKey(pre, fn)) is True
+
+        key = dgKey(regk, vdig.qb64b)
+        assert issuer.putTvts([(dgKey(regk, b"B"), vcpb), (key, vcpb)]) is True
+        assert issuer.putTvts([(key, b"x")]) is False  # no overwrite
+        assert issuer.getTvt(key) == vcpb
+        assert issuer.getTvt(dgKey(regk, b"B")) == vcpb
+        assert issuer.delTvt(key) is True
+        assert issuer.delTvt(dgKey(regk, b"B")) is True
+
         # not sure how these are generated in the first place
         coupl01 = ("BPVuWC4Hc0izqPKn2LIwhp72SHJSRgfaL1RhtuiavIy4AAfiKvopJ0O2afOmxb5A6JtdY7Wkl_1uNx1Z8xQkg_"
                    "gMzf-vTfEHDylFdgn2e_u_ppaFajIdvEvONX6dcSYzlfBQ").encode("utf-8")
@@ -145,6 +165,17 @@ def test_issuer():
             assert issuer.delTibs(key, c) is True
         assert issuer.getTibs(key) == []
 
+        # indexed sigs at one key may differ in size such as big index codes
+        signer = Signer(transferable=False)
+        tib = signer.sign(vcpb, index=0).qb64b  # code A
+        bigtib = signer.sign(vcpb, index=64).qb64b  # code 2A
+        assert len(tib) != len(bigtib)
+        assert issuer.putTibs(key, vals=[tib, bigtib]) is True
+        assert issuer.cntTibs(key) == 2
+        assert issuer.addTib(key, coupl01) is True
+        assert issuer.getTibs(key) == sorted([tib, bigtib, coupl01])
+        assert issuer.delTibs(key) is True
+
         tweKey = snKey(regk, sn)
         assert issuer.getTwe(tweKey) is None
         assert issuer.delTwe(tweKey) is False
@@ -234,6 +265,12 @@ def test_issuer():
         result = [(sn, dig) for sn, dig in issuer.getTelItemPreIter(vcdig)]
         assert result == [(0, idig.qb64b), (1, rdig.qb64b), (2, idig.qb64b), (3, rdig.qb64b)]
 
+        result = [(sn, dig) for sn, dig in issuer.getTelItemRangeIter(vcdig, fn=1, end=3)]
+        assert result == [(1, rdig.qb64b), (2, idig.qb64b)]
+        result = [(sn, dig) for sn, dig in issuer.getTelItemRangeIter(vcdig.decode("utf-8"), fn=2)]
+        assert result == [(2, idig.qb64b), (3, rdig.qb64b)]
+        assert list(issuer.getTelItemRangeIter(vcdig[:-1])) == []
+
         bak1 = b'BA1Q98kT0HRn9R62lY-LufjjKdbCeL1mqu9arTgOmbqI'
         bak2 = b'DAEpNJeSJjxo6oAxkNE8eCOJg2HRPstqkeHWBAvN9XNU'
         bak3 = b'DBxo-P4W_Z0xXTfoA3_4DMPn7oi0mLCElOWJDpC0nQXw'
@@ -257,6 +294,12 @@ def test_issuer():
         assert issuer.delBaks(key) is True
         assert issuer.getBaks(key) == []
 
+        # empty keys raise KeyError not lmdb.BadValsizeError
+        with pytest.raises(KeyError):
+            issuer.getTibs(b"")
+        with pytest.raises(KeyError):
+            issuer.getBaks(b"")
+
     """End Test"""
 
 
@@ -341,6 +384,12 @@ def test_clone():
           b'PjioY7Ycna6ouhSSH0QcKsEjce10HCXIW_XtmEYr9SrB5BA-GAB0AAAAAAAAAAAA'
           b'AAAAAAAAABCEzpq06UecHwzy-K9FpNoRxCJp2wIGM9u2Edk-PLMZ1H4')
 
+        clones = list(issuer.clonePreIter(regk, fn=1))
+        assert len(clones) == 2
+        assert issuer.cloneTvtAt(regk, sn + 1) == clones[0]
+        assert issuer.cloneTvtAt(regk, sn + 2) == clones[1]
+        assert issuer.cloneTvt(regk, r2dig.qb64b) == clones[1]
+
 
 if __name__ == "__main__":
     test_issuer()